@@ -0,0 +1,263 @@
+"""Bulk loading of EIA time-series rows.
+
+Small batches go through a regular executemany INSERT; anything at or above COPY_THRESHOLD rows
+is streamed to PostgreSQL with COPY, which skips the per-row statement overhead. The yearly
+partitions the rows need are created first. Columns with a server default are left out of the
+column list for rows that don't set them, so the database fills them in. Materialized views built
+on the loaded table are refreshed once the session commits.
+"""
+
+import csv
+import io
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, NamedTuple, Sequence, Set, Tuple, Type, TypeVar
+
+import asyncpg
+from sqlalchemy import Column, Connection, DefaultClause, Table, TextClause, insert, text
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session, SQLModel
+
+from app.database import (
+    dependent_views,
+    ensure_partitions,
+    is_partitioned,
+    mark_written,
+    partition_column,
+    partition_statements,
+    refresh_statement,
+)
+
+COPY_THRESHOLD = 100
+# past this many combinations of set/unset server-defaulted columns, constant defaults are written explicitly
+MAX_COPY_GROUPS = 4
+COPY_NULL = "\\N"
+
+T = TypeVar("T", bound=SQLModel)
+
+# bind processors from the psycopg2 dialect turn enums and JSON payloads into plain values for COPY
+_DIALECT = postgresql.dialect()
+
+
+def _table(model_cls: Type[SQLModel]) -> Table:
+    return model_cls.__table__  # type: ignore[attr-defined]
+
+
+def _server_generated(table: Table, column: Column) -> bool:
+    return column is table.autoincrement_column or column.server_default is not None
+
+
+class _CopyPlan(NamedTuple):
+    """Column order and value extraction for one table and set of supplied server-generated columns.
+
+    values() substitutes the constant server default for filled columns the row leaves unset.
+    """
+
+    columns: Tuple[Column, ...]
+    values: Callable[[Any], Tuple[Any, ...]]
+    processors: Tuple[Tuple[int, Callable[[Any], Any]], ...]
+
+
+@lru_cache(maxsize=None)
+def _constant_defaults(table: Table) -> Dict[str, Any]:
+    """Python values of numeric server defaults given as a literal, e.g. server_default=text("0")"""
+    defaults: Dict[str, Any] = {}
+    for column in table.columns:
+        default = column.server_default
+        if isinstance(default, DefaultClause) and isinstance(default.arg, TextClause):
+            python_type = column.type.python_type
+            if python_type in (int, float):
+                defaults[column.name] = python_type(default.arg.text)
+    return defaults
+
+
+def _filling_defaults(
+    values: Callable[[Any], Tuple[Any, ...]], defaults: Tuple[Tuple[int, Any], ...]
+) -> Callable[[Any], Tuple[Any, ...]]:
+    def filled_values(row: Any) -> Tuple[Any, ...]:
+        record = values(row)
+        if None not in record:
+            return record
+        filled = list(record)
+        for index, default in defaults:
+            if filled[index] is None:
+                filled[index] = default
+        return tuple(filled)
+
+    return filled_values
+
+
+@lru_cache(maxsize=None)
+def _plan(table: Table, supplied: FrozenSet[str], filled: FrozenSet[str] = frozenset()) -> _CopyPlan:
+    columns = tuple(
+        column
+        for column in table.columns
+        if not _server_generated(table, column) or column.name in supplied or column.name in filled
+    )
+    getter = attrgetter(*(column.name for column in columns))
+    values = getter if len(columns) > 1 else lambda row: (getter(row),)
+    if filled:
+        constants = _constant_defaults(table)
+        defaults = tuple(
+            (index, constants[column.name]) for index, column in enumerate(columns) if column.name in filled
+        )
+        values = _filling_defaults(values, defaults)
+    processors = tuple(
+        (index, process)
+        for index, process in enumerate(column.type.bind_processor(_DIALECT) for column in columns)
+        if process is not None
+    )
+    return _CopyPlan(columns, values, processors)
+
+
+@lru_cache(maxsize=None)
+def _server_generated_names(table: Table) -> Tuple[str, ...]:
+    return tuple(column.name for column in table.columns if _server_generated(table, column))
+
+
+def _group_by_supplied(rows: Sequence[T], names: Sequence[str]) -> Dict[FrozenSet[str], List[T]]:
+    groups: Dict[FrozenSet[str], List[T]] = {}
+    for row in rows:
+        supplied = frozenset(name for name in names if getattr(row, name) is not None)
+        groups.setdefault(supplied, []).append(row)
+    return groups
+
+
+def _batches(table: Table, rows: Sequence[T]) -> List[Tuple[_CopyPlan, List[T]]]:
+    """Group rows by the server-generated columns they set; the others are omitted so their defaults apply.
+
+    Each group costs a statement, and n server-defaulted columns allow up to 2**n groups. Past
+    MAX_COPY_GROUPS, columns whose default is a constant are always written, with the default
+    filled in, and rows are only grouped by the remaining ones (the id sequence, now()).
+    """
+    names = _server_generated_names(table)
+    groups = _group_by_supplied(rows, names)
+    if len(groups) <= MAX_COPY_GROUPS:
+        return [(_plan(table, supplied), group) for supplied, group in groups.items()]
+
+    filled = frozenset(_constant_defaults(table))
+    groups = _group_by_supplied(rows, [name for name in names if name not in filled])
+    return [(_plan(table, supplied, filled), group) for supplied, group in groups.items()]
+
+
+def _partition_years(table: Table, rows: Sequence[SQLModel]) -> Set[int]:
+    column = partition_column(table)
+    return {getattr(row, column).year for row in rows}
+
+
+def _records(rows: Sequence[SQLModel], plan: _CopyPlan) -> List[Tuple[Any, ...]]:
+    """Positional records in plan column order, with enums and JSON payloads bound for the driver"""
+    records = [plan.values(row) for row in rows]
+    if not plan.processors:
+        return records
+    processed = []
+    for record in records:
+        values = list(record)
+        for index, process in plan.processors:
+            if values[index] is not None:
+                values[index] = process(values[index])
+        processed.append(tuple(values))
+    return processed
+
+
+def copy_buffer(records: Sequence[Tuple[Any, ...]]) -> io.StringIO:
+    """Serialize records as tab-separated CSV, writing None as the COPY null marker"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter="\t", quoting=csv.QUOTE_MINIMAL, lineterminator="\n")
+    writer.writerows(
+        record if None not in record else tuple(COPY_NULL if value is None else value for value in record)
+        for record in records
+    )
+    buffer.seek(0)
+    return buffer
+
+
+def _copy_statement(table: Table, columns: Sequence[Column]) -> str:
+    preparer = _DIALECT.identifier_preparer
+    column_list = ", ".join(preparer.quote(column.name) for column in columns)
+    return (
+        f"COPY {preparer.format_table(table)} ({column_list}) "
+        f"FROM STDIN WITH (FORMAT csv, DELIMITER E'\\t', NULL '{COPY_NULL}')"
+    )
+
+
+@contextmanager
+def _without_statement_timeout(conn: Connection) -> Iterator[None]:
+    """Lift the engine's statement_timeout for a load, restoring it for the rest of the transaction.
+
+    Nothing is restored when the load raises, since the transaction can only be rolled back then.
+    """
+    previous = conn.execute(text("SHOW statement_timeout")).scalar()
+    conn.execute(text("SET LOCAL statement_timeout = 0"))
+    yield
+    conn.execute(text("SELECT set_config('statement_timeout', :value, true)"), {"value": previous})
+
+
+def bulk_copy(session: Session, model_cls: Type[T], rows: Sequence[T]) -> int:
+    """Insert rows of model_cls within the session's transaction, using COPY for large batches.
+
+    The engine's 1s statement_timeout does not apply to the load itself; it is restored afterwards.
+    Rows are written with one statement per combination of server-defaulted columns they set, at
+    most MAX_COPY_GROUPS before constant defaults are written explicitly (see _batches).
+
+    Dependent materialized views are refreshed when the session commits (see app.database.get_session).
+    """
+    if not rows:
+        return 0
+
+    table = _table(model_cls)
+    if is_partitioned(table):
+        ensure_partitions(session.connection(), table, _partition_years(table, rows))
+    use_copy = len(rows) >= COPY_THRESHOLD
+
+    with _without_statement_timeout(session.connection()):
+        for plan, batch in _batches(table, rows):
+            if use_copy:
+                buffer = copy_buffer(_records(batch, plan))
+                dbapi_connection = session.connection().connection
+                with dbapi_connection.cursor() as cursor:
+                    cursor.copy_expert(_copy_statement(table, plan.columns), buffer)
+            else:
+                names = [column.name for column in plan.columns]
+                params = [dict(zip(names, plan.values(row))) for row in batch]
+                session.execute(insert(table), params)
+
+    mark_written(session, table)
+    return len(rows)
+
+
+async def bulk_copy_async(
+    conn: asyncpg.Connection, model_cls: Type[T], rows: Sequence[T], refresh_views: bool = True
+) -> int:
+    """asyncpg counterpart of bulk_copy for connections outside the SQLAlchemy engine.
+
+    There is no commit hook here, so dependent materialized views are refreshed on conn right after
+    the load unless refresh_views is False.
+    """
+    if not rows:
+        return 0
+
+    table = _table(model_cls)
+    if is_partitioned(table):
+        for statement in partition_statements(table, _partition_years(table, rows)):
+            await conn.execute(statement)
+    use_copy = len(rows) >= COPY_THRESHOLD
+
+    for plan, batch in _batches(table, rows):
+        names = [column.name for column in plan.columns]
+        records = _records(batch, plan)
+        if use_copy:
+            await conn.copy_records_to_table(table.name, records=records, columns=names, schema_name=table.schema)
+        else:
+            preparer = _DIALECT.identifier_preparer
+            column_list = ", ".join(preparer.quote(name) for name in names)
+            placeholders = ", ".join(f"${position}" for position in range(1, len(names) + 1))
+            await conn.executemany(
+                f"INSERT INTO {preparer.format_table(table)} ({column_list}) VALUES ({placeholders})", records
+            )
+
+    if refresh_views:
+        for view_name in dependent_views([table.name]):
+            await conn.execute(refresh_statement(view_name))
+    return len(rows)
@@ -1,48 +1,127 @@
-from sqlmodel import SQLModel, Field, Relationship, JSON, Column
+from sqlmodel import SQLModel, Field, Relationship, Column
+from sqlalchemy import CheckConstraint, DateTime, Float, ForeignKeyConstraint, Index, Integer, SmallInteger, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import declared_attr, deferred, undefer_group
+from sqlalchemy.orm.interfaces import LoaderOption
+from sqlalchemy.types import TypeDecorator
+from pydantic import ConfigDict
 from datetime import datetime, date
-from typing import Optional, List, Dict, Any
-from decimal import Decimal
+from typing import Optional, List, Dict, Any, Type
 from enum import Enum
 
 
-class DataSourceType(str, Enum):
-    STEO = "STEO"  # Short-Term Energy Outlook
-    PSM = "PSM"  # Petroleum Supply Monthly
-    WEEKLY = "WEEKLY"  # Weekly Petroleum Status Report
+class DataSourceType(int, Enum):
+    STEO = 1  # Short-Term Energy Outlook
+    PSM = 2  # Petroleum Supply Monthly
+    WEEKLY = 3  # Weekly Petroleum Status Report
 
 
-class ProductType(str, Enum):
-    CRUDE_OIL = "CRUDE_OIL"
-    GASOLINE = "GASOLINE"
-    DISTILLATE = "DISTILLATE"
-    RESIDUAL = "RESIDUAL"
-    JET_FUEL = "JET_FUEL"
-    PROPANE = "PROPANE"
-    NATURAL_GAS = "NATURAL_GAS"
+class ProductType(int, Enum):
+    CRUDE_OIL = 1
+    GASOLINE = 2
+    DISTILLATE = 3
+    RESIDUAL = 4
+    JET_FUEL = 5
+    PROPANE = 6
+    NATURAL_GAS = 7
 
 
-class DispositionType(str, Enum):
-    PRODUCTION = "PRODUCTION"
-    IMPORTS = "IMPORTS"
-    EXPORTS = "EXPORTS"
-    STOCK_CHANGE = "STOCK_CHANGE"
-    REFINERY_INPUT = "REFINERY_INPUT"
-    DEMAND = "DEMAND"
+class DispositionType(int, Enum):
+    PRODUCTION = 1
+    IMPORTS = 2
+    EXPORTS = 3
+    STOCK_CHANGE = 4
+    REFINERY_INPUT = 5
+    DEMAND = 6
 
 
-class ScenarioType(str, Enum):
-    BASELINE = "BASELINE"
-    HURRICANE = "HURRICANE"
-    SUPPLY_SHOCK = "SUPPLY_SHOCK"
-    DEMAND_SURGE = "DEMAND_SURGE"
-    REFINERY_OUTAGE = "REFINERY_OUTAGE"
+class ScenarioType(int, Enum):
+    BASELINE = 1
+    HURRICANE = 2
+    SUPPLY_SHOCK = 3
+    DEMAND_SURGE = 4
+    REFINERY_OUTAGE = 5
 
 
-class SeverityLevel(str, Enum):
-    LOW = "LOW"
-    MODERATE = "MODERATE"
-    HIGH = "HIGH"
-    EXTREME = "EXTREME"
+class SeverityLevel(int, Enum):
+    LOW = 1
+    MODERATE = 2
+    HIGH = 3
+    EXTREME = 4
+
+
+class Unit(int, Enum):
+    BBL = 1  # bbl
+    MBBL = 2  # Mbbl
+    BBL_D = 3  # bbl/d
+    MBBL_D = 4  # Mbbl/d
+    USD_BBL = 5  # $/bbl
+    USD_GAL = 6  # $/gal
+    USD_MMBTU = 7  # $/MMBtu
+    BCF = 8  # Bcf
+    MMCF_D = 9  # MMcf/d
+    PERCENT = 10  # %
+
+
+class PriceType(int, Enum):
+    SPOT = 1
+    FUTURES = 2
+    RETAIL = 3
+    WHOLESALE = 4
+
+
+class OutputFormat(int, Enum):
+    PDF = 1
+    CSV = 2
+    JSON = 3
+
+
+class ThresholdOperator(int, Enum):
+    GT = 1  # >
+    LT = 2  # <
+    GE = 3  # >=
+    LE = 4  # <=
+    EQ = 5  # =
+
+
+class IntEnumType(TypeDecorator):
+    """Stores an int-valued Enum as SMALLINT and hands back enum members on load"""
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_cls: Type[Enum]):
+        super().__init__()
+        self.enum_cls = enum_cls
+
+    def process_bind_param(self, value: Optional[Enum], dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return self.enum_cls(value).value
+
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[Enum]:
+        if value is None:
+            return None
+        return self.enum_cls(value)
+
+
+# JSON payloads that list views never show are left out of the default SELECT
+DEFERRED_PAYLOAD_GROUP = "payload"
+
+
+def deferred_payload(model_cls: Any, *column_names: str) -> Dict[str, Any]:
+    """__mapper_args__ mapping the given columns as deferred; they load on first access or via with_loaded_configs()"""
+    table = model_cls.__table__
+    return {"properties": {name: deferred(table.c[name], group=DEFERRED_PAYLOAD_GROUP) for name in column_names}}
+
+
+def with_loaded_configs() -> LoaderOption:
+    """Loader option fetching the deferred payload columns in the main query"""
+    return undefer_group(DEFERRED_PAYLOAD_GROUP)
+
+
+# Tables whose rows are updated in place leave free space in each page so updates can stay HOT
+HOT_UPDATE_FILLFACTOR = 70
 
 
 # Core Data Models
@@ -52,21 +131,41 @@ class EIADataPoint(SQLModel, table=True):
     """Base model for all EIA data points"""
 
     __tablename__ = "eia_data_points"  # type: ignore[assignment]
-
-    id: Optional[int] = Field(default=None, primary_key=True)
-    series_id: str = Field(max_length=100, index=True)
-    data_source: DataSourceType
-    product_type: ProductType
-    disposition_type: DispositionType
-    period_date: date = Field(index=True)
-    value: Decimal = Field(decimal_places=2, max_digits=15)
-    unit: str = Field(max_length=50)
+    __table_args__ = (
+        Index(
+            "ix_eia_data_points_product_type_disposition_type_period_date",
+            "product_type",
+            "disposition_type",
+            "period_date",
+            postgresql_include=["value", "unit"],
+        ),
+        Index(
+            "ix_eia_data_points_series_id_period_date", "series_id", "period_date", postgresql_include=["value", "unit"]
+        ),
+        {"postgresql_partition_by": "RANGE (period_date)"},
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True, sa_column_kwargs={"autoincrement": True})
+    series_id: str = Field(max_length=100)
+    data_source: DataSourceType = Field(sa_column=Column(IntEnumType(DataSourceType), nullable=False))
+    product_type: ProductType = Field(sa_column=Column(IntEnumType(ProductType), nullable=False))
+    disposition_type: DispositionType = Field(sa_column=Column(IntEnumType(DispositionType), nullable=False))
+    period_date: date = Field(primary_key=True, index=True)
+    value: float
+    unit: Unit = Field(sa_column=Column(IntEnumType(Unit), nullable=False))
     region: Optional[str] = Field(default=None, max_length=100)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
+    updated_at: datetime = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False),
+    )
 
     # Relationships
-    supply_disposition_entries: List["SupplyDisposition"] = Relationship(back_populates="data_point")
+    supply_disposition_entries: List["SupplyDisposition"] = Relationship(
+        back_populates="data_point", sa_relationship_kwargs={"lazy": "raise", "viewonly": True}
+    )
 
 
 class STEOData(SQLModel, table=True):
@@ -76,45 +175,63 @@ class STEOData(SQLModel, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
     series_id: str = Field(max_length=100, index=True)
-    product_type: ProductType
+    product_type: ProductType = Field(sa_column=Column(IntEnumType(ProductType), nullable=False))
     forecast_period: date
-    forecast_value: Decimal = Field(decimal_places=2, max_digits=15)
-    unit: str = Field(max_length=50)
-    confidence_interval_low: Optional[Decimal] = Field(default=None, decimal_places=2, max_digits=15)
-    confidence_interval_high: Optional[Decimal] = Field(default=None, decimal_places=2, max_digits=15)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    forecast_value: float
+    unit: Unit = Field(sa_column=Column(IntEnumType(Unit), nullable=False))
+    confidence_interval_low: Optional[float] = Field(default=None)
+    confidence_interval_high: Optional[float] = Field(default=None)
+    created_at: datetime = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
 
 
 class PSMData(SQLModel, table=True):
     """Petroleum Supply Monthly specific data"""
 
     __tablename__ = "psm_data"  # type: ignore[assignment]
+    __table_args__ = {"info": {"fillfactor": HOT_UPDATE_FILLFACTOR}}
 
     id: Optional[int] = Field(default=None, primary_key=True)
     series_id: str = Field(max_length=100, index=True)
-    product_type: ProductType
-    disposition_type: DispositionType
+    product_type: ProductType = Field(sa_column=Column(IntEnumType(ProductType), nullable=False))
+    disposition_type: DispositionType = Field(sa_column=Column(IntEnumType(DispositionType), nullable=False))
     report_month: date
-    value: Decimal = Field(decimal_places=2, max_digits=15)
-    unit: str = Field(max_length=50)
+    value: float
+    unit: Unit = Field(sa_column=Column(IntEnumType(Unit), nullable=False))
     revision_flag: bool = Field(default=False)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
 
 
 class WeeklyData(SQLModel, table=True):
     """Weekly Petroleum Status Report data"""
 
     __tablename__ = "weekly_data"  # type: ignore[assignment]
-
-    id: Optional[int] = Field(default=None, primary_key=True)
-    series_id: str = Field(max_length=100, index=True)
-    product_type: ProductType
-    disposition_type: DispositionType
-    week_ending: date = Field(index=True)
-    value: Decimal = Field(decimal_places=2, max_digits=15)
-    unit: str = Field(max_length=50)
+    __table_args__ = (
+        Index(
+            "ix_weekly_data_product_type_disposition_type_week_ending",
+            "product_type",
+            "disposition_type",
+            "week_ending",
+            postgresql_include=["value", "unit"],
+        ),
+        Index("ix_weekly_data_series_id_week_ending", "series_id", "week_ending", postgresql_include=["value", "unit"]),
+        {"postgresql_partition_by": "RANGE (week_ending)"},
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True, sa_column_kwargs={"autoincrement": True})
+    series_id: str = Field(max_length=100)
+    product_type: ProductType = Field(sa_column=Column(IntEnumType(ProductType), nullable=False))
+    disposition_type: DispositionType = Field(sa_column=Column(IntEnumType(DispositionType), nullable=False))
+    week_ending: date = Field(primary_key=True, index=True)
+    value: float
+    unit: Unit = Field(sa_column=Column(IntEnumType(Unit), nullable=False))
     seasonal_adjustment: Optional[str] = Field(default=None, max_length=50)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
 
 
 # Supply Disposition Models
@@ -124,29 +241,90 @@ class SupplyDisposition(SQLModel, table=True):
     """Supply and disposition balance for petroleum products"""
 
     __tablename__ = "supply_disposition"  # type: ignore[assignment]
-
-    id: Optional[int] = Field(default=None, primary_key=True)
-    product_type: ProductType
-    period_date: date = Field(index=True)
-    data_point_id: Optional[int] = Field(default=None, foreign_key="eia_data_points.id")
+    __table_args__ = (
+        # the summary query filters on region only optionally, so product_type + date needs its own index
+        Index("ix_supply_disposition_product_type_period_date", "product_type", "period_date"),
+        Index("ix_supply_disposition_product_type_region_period_date", "product_type", "region", "period_date"),
+        ForeignKeyConstraint(["data_point_id", "period_date"], ["eia_data_points.id", "eia_data_points.period_date"]),
+        {"postgresql_partition_by": "RANGE (period_date)"},
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True, sa_column_kwargs={"autoincrement": True})
+    product_type: ProductType = Field(sa_column=Column(IntEnumType(ProductType), nullable=False))
+    period_date: date = Field(primary_key=True, index=True)
+    data_point_id: Optional[int] = Field(default=None)
 
     # Supply components
-    production: Decimal = Field(default=Decimal("0"), decimal_places=2, max_digits=15)
-    imports: Decimal = Field(default=Decimal("0"), decimal_places=2, max_digits=15)
-    stock_withdrawal: Decimal = Field(default=Decimal("0"), decimal_places=2, max_digits=15)
+    production: float = Field(default=None, sa_column=Column(Float, nullable=False, server_default=text("0")))
+    imports: float = Field(default=None, sa_column=Column(Float, nullable=False, server_default=text("0")))
+    stock_withdrawal: float = Field(default=None, sa_column=Column(Float, nullable=False, server_default=text("0")))
 
     # Disposition components
-    exports: Decimal = Field(default=Decimal("0"), decimal_places=2, max_digits=15)
-    refinery_input: Decimal = Field(default=Decimal("0"), decimal_places=2, max_digits=15)
-    product_supplied: Decimal = Field(default=Decimal("0"), decimal_places=2, max_digits=15)
-    stock_build: Decimal = Field(default=Decimal("0"), decimal_places=2, max_digits=15)
+    exports: float = Field(default=None, sa_column=Column(Float, nullable=False, server_default=text("0")))
+    refinery_input: float = Field(default=None, sa_column=Column(Float, nullable=False, server_default=text("0")))
+    product_supplied: float = Field(default=None, sa_column=Column(Float, nullable=False, server_default=text("0")))
+    stock_build: float = Field(default=None, sa_column=Column(Float, nullable=False, server_default=text("0")))
 
-    unit: str = Field(max_length=50)
+    unit: Unit = Field(sa_column=Column(IntEnumType(Unit), nullable=False))
     region: Optional[str] = Field(default=None, max_length=100)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
+
+    # Relationships (read-only: the link is written through data_point_id, since the join also uses the
+    # period_date primary key column, which must never be nulled when an entry is unlinked)
+    data_point: Optional["EIADataPoint"] = Relationship(
+        back_populates="supply_disposition_entries", sa_relationship_kwargs={"lazy": "raise", "viewonly": True}
+    )
 
-    # Relationships
-    data_point: Optional["EIADataPoint"] = Relationship(back_populates="supply_disposition_entries")
+
+class SupplyDispositionSummaryView(SQLModel, table=True):
+    """Mapping of the supply_disposition_summary materialized view (see app.database).
+
+    The view is read-only and skipped by create_all. It is refreshed after commits that write
+    supply_disposition; readers get SupplyDispositionSummary rows.
+    """
+
+    __tablename__ = "supply_disposition_summary"  # type: ignore[assignment]
+    __table_args__ = {"info": {"materialized_view": True, "refresh_after": ["supply_disposition"]}}
+
+    product_type: ProductType = Field(sa_column=Column(IntEnumType(ProductType), primary_key=True))
+    period_date: date = Field(primary_key=True)
+    total_supply: float
+    total_disposition: float
+    balance: float
+    unit: Unit = Field(sa_column=Column(IntEnumType(Unit), primary_key=True))
+    region: Optional[str] = Field(default=None, primary_key=True)
+
+
+# Region Models
+
+
+class Region(SQLModel, table=True):
+    """Regions (PADDs, states, refining hubs) referenced by scenarios and historical hurricanes"""
+
+    __tablename__ = "regions"  # type: ignore[assignment]
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    code: str = Field(unique=True, index=True, max_length=20)
+
+
+class ScenarioRegion(SQLModel, table=True):
+    """Link table between scenarios and the regions they affect"""
+
+    __tablename__ = "scenario_regions"  # type: ignore[assignment]
+
+    scenario_id: int = Field(foreign_key="scenarios.id", primary_key=True, ondelete="CASCADE")
+    region_id: int = Field(foreign_key="regions.id", primary_key=True, index=True, ondelete="CASCADE")
+
+
+class HurricaneRegion(SQLModel, table=True):
+    """Link table between historical hurricanes and the regions they affected"""
+
+    __tablename__ = "hurricane_regions"  # type: ignore[assignment]
+
+    hurricane_id: int = Field(foreign_key="hurricane_historical.id", primary_key=True, ondelete="CASCADE")
+    region_id: int = Field(foreign_key="regions.id", primary_key=True, index=True, ondelete="CASCADE")
 
 
 # Scenario Planning Models
@@ -156,57 +334,85 @@ class Scenario(SQLModel, table=True):
     """Scenario definitions for supply shock simulations"""
 
     __tablename__ = "scenarios"  # type: ignore[assignment]
+    __table_args__ = (
+        CheckConstraint("hurricane_category BETWEEN 1 AND 5", name="ck_scenarios_hurricane_category"),
+        CheckConstraint("production_impact_pct BETWEEN -100 AND 100", name="ck_scenarios_production_impact_pct"),
+        CheckConstraint(
+            "refining_capacity_impact_pct BETWEEN -100 AND 100", name="ck_scenarios_refining_capacity_impact_pct"
+        ),
+        CheckConstraint("import_disruption_pct BETWEEN -100 AND 100", name="ck_scenarios_import_disruption_pct"),
+        {"info": {"fillfactor": HOT_UPDATE_FILLFACTOR}},
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=200)
     description: str = Field(max_length=1000)
-    scenario_type: ScenarioType
-    severity_level: SeverityLevel
+    scenario_type: ScenarioType = Field(sa_column=Column(IntEnumType(ScenarioType), nullable=False))
+    severity_level: SeverityLevel = Field(sa_column=Column(IntEnumType(SeverityLevel), nullable=False))
     start_date: date
     end_date: date
 
     # Hurricane specific fields
-    hurricane_category: Optional[int] = Field(default=None, ge=1, le=5)
-    affected_regions: List[str] = Field(default=[], sa_column=Column(JSON))
+    hurricane_category: Optional[int] = Field(default=None)
 
     # Supply shock parameters
-    production_impact_pct: Decimal = Field(default=Decimal("0"), decimal_places=2, max_digits=5)
-    refining_capacity_impact_pct: Decimal = Field(default=Decimal("0"), decimal_places=2, max_digits=5)
-    import_disruption_pct: Decimal = Field(default=Decimal("0"), decimal_places=2, max_digits=5)
+    production_impact_pct: float = Field(
+        default=None, sa_column=Column(Float, nullable=False, server_default=text("0"))
+    )
+    refining_capacity_impact_pct: float = Field(
+        default=None, sa_column=Column(Float, nullable=False, server_default=text("0"))
+    )
+    import_disruption_pct: float = Field(
+        default=None, sa_column=Column(Float, nullable=False, server_default=text("0"))
+    )
 
     # Additional parameters
-    parameters: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
+    parameters: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSONB, nullable=False))
     is_active: bool = Field(default=True)
     created_by: Optional[str] = Field(default=None, max_length=100)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
 
     # Relationships
-    scenario_impacts: List["ScenarioImpact"] = Relationship(back_populates="scenario")
-    price_forecasts: List["PriceForecast"] = Relationship(back_populates="scenario")
+    scenario_impacts: List["ScenarioImpact"] = Relationship(
+        back_populates="scenario", sa_relationship_kwargs={"lazy": "raise"}
+    )
+    price_forecasts: List["PriceForecast"] = Relationship(
+        back_populates="scenario", sa_relationship_kwargs={"lazy": "raise"}
+    )
+    regions: List["Region"] = Relationship(link_model=ScenarioRegion, sa_relationship_kwargs={"lazy": "raise"})
 
 
 class ScenarioImpact(SQLModel, table=True):
     """Impact calculations for specific scenarios"""
 
     __tablename__ = "scenario_impacts"  # type: ignore[assignment]
+    __table_args__ = (
+        # a relative change: a value can at most drop to zero, but can grow by more than 100%
+        CheckConstraint("impact_percentage >= -100", name="ck_scenario_impacts_impact_percentage"),
+        {"postgresql_partition_by": "RANGE (impact_date)"},
+    )
 
-    id: Optional[int] = Field(default=None, primary_key=True)
+    id: Optional[int] = Field(default=None, primary_key=True, sa_column_kwargs={"autoincrement": True})
     scenario_id: int = Field(foreign_key="scenarios.id")
-    product_type: ProductType
-    disposition_type: DispositionType
-    impact_date: date
+    product_type: ProductType = Field(sa_column=Column(IntEnumType(ProductType), nullable=False))
+    disposition_type: DispositionType = Field(sa_column=Column(IntEnumType(DispositionType), nullable=False))
+    impact_date: date = Field(primary_key=True)
 
-    baseline_value: Decimal = Field(decimal_places=2, max_digits=15)
-    scenario_value: Decimal = Field(decimal_places=2, max_digits=15)
-    impact_absolute: Decimal = Field(decimal_places=2, max_digits=15)
-    impact_percentage: Decimal = Field(decimal_places=2, max_digits=5)
+    baseline_value: float
+    scenario_value: float
+    impact_absolute: float
+    impact_percentage: float
 
-    unit: str = Field(max_length=50)
+    unit: Unit = Field(sa_column=Column(IntEnumType(Unit), nullable=False))
     region: Optional[str] = Field(default=None, max_length=100)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
 
     # Relationships
-    scenario: "Scenario" = Relationship(back_populates="scenario_impacts")
+    scenario: "Scenario" = Relationship(back_populates="scenario_impacts", sa_relationship_kwargs={"lazy": "raise"})
 
 
 # Pricing Models
@@ -216,46 +422,63 @@ class PriceData(SQLModel, table=True):
     """Historical and current pricing data"""
 
     __tablename__ = "price_data"  # type: ignore[assignment]
-
-    id: Optional[int] = Field(default=None, primary_key=True)
-    product_type: ProductType
-    price_date: date = Field(index=True)
-    price: Decimal = Field(decimal_places=4, max_digits=10)
-    price_type: str = Field(max_length=50)  # spot, futures, retail, wholesale
+    __table_args__ = (
+        Index(
+            "ix_price_data_product_type_location_price_date",
+            "product_type",
+            "location",
+            "price_date",
+            postgresql_include=["price", "unit"],
+        ),
+        {"postgresql_partition_by": "RANGE (price_date)"},
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True, sa_column_kwargs={"autoincrement": True})
+    product_type: ProductType = Field(sa_column=Column(IntEnumType(ProductType), nullable=False))
+    price_date: date = Field(primary_key=True, index=True)
+    price: float
+    price_type: PriceType = Field(sa_column=Column(IntEnumType(PriceType), nullable=False))
     location: str = Field(max_length=100)
-    unit: str = Field(max_length=50)
+    unit: Unit = Field(sa_column=Column(IntEnumType(Unit), nullable=False))
 
     # Market indicators
-    volume: Optional[Decimal] = Field(default=None, decimal_places=2, max_digits=15)
-    open_interest: Optional[Decimal] = Field(default=None, decimal_places=2, max_digits=15)
-    volatility: Optional[Decimal] = Field(default=None, decimal_places=4, max_digits=8)
+    volume: Optional[float] = Field(default=None)
+    open_interest: Optional[float] = Field(default=None)
+    volatility: Optional[float] = Field(default=None)
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
 
 
 class PriceForecast(SQLModel, table=True):
     """Price forecasts under different scenarios"""
 
     __tablename__ = "price_forecasts"  # type: ignore[assignment]
+    __table_args__ = {"postgresql_partition_by": "RANGE (forecast_date)"}
 
-    id: Optional[int] = Field(default=None, primary_key=True)
+    id: Optional[int] = Field(default=None, primary_key=True, sa_column_kwargs={"autoincrement": True})
     scenario_id: Optional[int] = Field(default=None, foreign_key="scenarios.id")
-    product_type: ProductType
-    forecast_date: date
-    forecast_price: Decimal = Field(decimal_places=4, max_digits=10)
-    baseline_price: Decimal = Field(decimal_places=4, max_digits=10)
-    price_impact: Decimal = Field(decimal_places=4, max_digits=10)
-    price_impact_pct: Decimal = Field(decimal_places=2, max_digits=5)
-
-    confidence_level: Optional[Decimal] = Field(default=None, decimal_places=2, max_digits=5)
-    price_type: str = Field(max_length=50)
+    product_type: ProductType = Field(sa_column=Column(IntEnumType(ProductType), nullable=False))
+    forecast_date: date = Field(primary_key=True)
+    forecast_price: float
+    baseline_price: float
+    price_impact: float
+    price_impact_pct: float
+
+    confidence_level: Optional[float] = Field(default=None)
+    price_type: PriceType = Field(sa_column=Column(IntEnumType(PriceType), nullable=False))
     location: str = Field(max_length=100)
-    unit: str = Field(max_length=50)
+    unit: Unit = Field(sa_column=Column(IntEnumType(Unit), nullable=False))
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
 
     # Relationships
-    scenario: Optional["Scenario"] = Relationship(back_populates="price_forecasts")
+    scenario: Optional["Scenario"] = Relationship(
+        back_populates="price_forecasts", sa_relationship_kwargs={"lazy": "raise"}
+    )
 
 
 # Seasonality Models
@@ -265,66 +488,111 @@ class SeasonalPattern(SQLModel, table=True):
     """Seasonal patterns for different products and regions"""
 
     __tablename__ = "seasonal_patterns"  # type: ignore[assignment]
+    __table_args__ = (
+        CheckConstraint("month BETWEEN 1 AND 12", name="ck_seasonal_patterns_month"),
+        CheckConstraint("years_of_data >= 1", name="ck_seasonal_patterns_years_of_data"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    product_type: ProductType
-    disposition_type: DispositionType
-    month: int = Field(ge=1, le=12)
+    product_type: ProductType = Field(sa_column=Column(IntEnumType(ProductType), nullable=False))
+    disposition_type: DispositionType = Field(sa_column=Column(IntEnumType(DispositionType), nullable=False))
+    month: int
     region: Optional[str] = Field(default=None, max_length=100)
 
     # Seasonal adjustment factors
-    seasonal_index: Decimal = Field(decimal_places=4, max_digits=6)
-    trend_factor: Decimal = Field(default=Decimal("1.0"), decimal_places=4, max_digits=6)
-    volatility_multiplier: Decimal = Field(default=Decimal("1.0"), decimal_places=4, max_digits=6)
+    seasonal_index: float
+    trend_factor: float = Field(default=None, sa_column=Column(Float, nullable=False, server_default=text("1")))
+    volatility_multiplier: float = Field(
+        default=None, sa_column=Column(Float, nullable=False, server_default=text("1"))
+    )
 
     # Historical basis
-    years_of_data: int = Field(default=10, ge=1)
-    last_updated: datetime = Field(default_factory=datetime.utcnow)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    years_of_data: int = Field(default=10)
+    last_updated: datetime = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False),
+    )
+    created_at: datetime = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
 
 
 class HurricaneHistorical(SQLModel, table=True):
     """Historical hurricane impact data for model calibration"""
 
     __tablename__ = "hurricane_historical"  # type: ignore[assignment]
+    __table_args__ = (
+        CheckConstraint("year >= 1950", name="ck_hurricane_historical_year"),
+        CheckConstraint("category BETWEEN 1 AND 5", name="ck_hurricane_historical_category"),
+        CheckConstraint(
+            "refinery_capacity_lost_pct BETWEEN 0 AND 100", name="ck_hurricane_historical_refinery_capacity_lost_pct"
+        ),
+        CheckConstraint("production_disruption_days >= 0", name="ck_hurricane_historical_production_disruption_days"),
+        CheckConstraint("recovery_days_production >= 0", name="ck_hurricane_historical_recovery_days_production"),
+        CheckConstraint("recovery_days_refining >= 0", name="ck_hurricane_historical_recovery_days_refining"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     hurricane_name: str = Field(max_length=100)
-    year: int = Field(ge=1950)
-    category: int = Field(ge=1, le=5)
+    year: int
+    category: int
     landfall_date: date
 
-    affected_regions: List[str] = Field(default=[], sa_column=Column(JSON))
-
     # Impact metrics
-    refinery_capacity_lost_pct: Decimal = Field(default=Decimal("0"), decimal_places=2, max_digits=5)
-    production_disruption_days: int = Field(default=0, ge=0)
-    price_spike_gasoline_pct: Decimal = Field(default=Decimal("0"), decimal_places=2, max_digits=8)
-    price_spike_crude_pct: Decimal = Field(default=Decimal("0"), decimal_places=2, max_digits=8)
+    refinery_capacity_lost_pct: float = Field(
+        default=None, sa_column=Column(Float, nullable=False, server_default=text("0"))
+    )
+    production_disruption_days: int = Field(
+        default=None, sa_column=Column(Integer, nullable=False, server_default=text("0"))
+    )
+    price_spike_gasoline_pct: float = Field(
+        default=None, sa_column=Column(Float, nullable=False, server_default=text("0"))
+    )
+    price_spike_crude_pct: float = Field(
+        default=None, sa_column=Column(Float, nullable=False, server_default=text("0"))
+    )
 
     # Recovery metrics
-    recovery_days_production: int = Field(default=0, ge=0)
-    recovery_days_refining: int = Field(default=0, ge=0)
+    recovery_days_production: int = Field(
+        default=None, sa_column=Column(Integer, nullable=False, server_default=text("0"))
+    )
+    recovery_days_refining: int = Field(
+        default=None, sa_column=Column(Integer, nullable=False, server_default=text("0"))
+    )
 
     notes: Optional[str] = Field(default=None, max_length=1000)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
+
+    # Relationships
+    regions: List["Region"] = Relationship(link_model=HurricaneRegion, sa_relationship_kwargs={"lazy": "raise"})
 
 
 # Dashboard Configuration Models
 
 
 class DashboardConfig(SQLModel, table=True):
-    """Configuration for dashboard displays and reports"""
+    """Configuration for dashboard displays and reports.
+
+    chart_configs and data_filters are deferred. Query with with_loaded_configs() whenever the
+    payloads are needed outside the session, including model_dump() and other serializers.
+    """
 
     __tablename__ = "dashboard_config"  # type: ignore[assignment]
+    __table_args__ = {"info": {"fillfactor": HOT_UPDATE_FILLFACTOR}}
+
+    @declared_attr.directive
+    def __mapper_args__(cls) -> Dict[str, Any]:
+        return deferred_payload(cls, "chart_configs", "data_filters")
 
     id: Optional[int] = Field(default=None, primary_key=True)
     config_name: str = Field(max_length=100, unique=True)
     dashboard_type: str = Field(max_length=50)  # supply_disposition, scenario_analysis, price_forecast
 
     # Display configuration
-    chart_configs: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-    data_filters: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
+    chart_configs: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSONB, nullable=False))
+    data_filters: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSONB, nullable=False))
     refresh_interval_minutes: int = Field(default=60, ge=1)
 
     # Report settings
@@ -334,36 +602,62 @@ class DashboardConfig(SQLModel, table=True):
 
     is_active: bool = Field(default=True)
     created_by: Optional[str] = Field(default=None, max_length=100)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
+    updated_at: datetime = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False),
+    )
 
 
 class ReportTemplate(SQLModel, table=True):
-    """Templates for automated reports"""
+    """Templates for automated reports.
+
+    chart_specifications and recipients are deferred. Query with with_loaded_configs() whenever the
+    payloads are needed outside the session, including model_dump() and other serializers.
+    """
 
     __tablename__ = "report_templates"  # type: ignore[assignment]
+    __table_args__ = (
+        Index(
+            "ix_report_templates_regions_included",
+            "regions_included",
+            postgresql_using="gin",
+            postgresql_ops={"regions_included": "jsonb_path_ops"},
+        ),
+        {"info": {"fillfactor": HOT_UPDATE_FILLFACTOR}},
+    )
+
+    @declared_attr.directive
+    def __mapper_args__(cls) -> Dict[str, Any]:
+        return deferred_payload(cls, "chart_specifications", "recipients")
 
     id: Optional[int] = Field(default=None, primary_key=True)
     template_name: str = Field(max_length=200)
     report_type: str = Field(max_length=50)  # weekly_summary, scenario_analysis, price_alert
 
     # Template configuration
-    data_sources: List[str] = Field(default=[], sa_column=Column(JSON))
-    products_included: List[str] = Field(default=[], sa_column=Column(JSON))
-    regions_included: List[str] = Field(default=[], sa_column=Column(JSON))
+    data_sources: List[str] = Field(default_factory=list, sa_column=Column(JSONB, nullable=False))
+    products_included: List[str] = Field(default_factory=list, sa_column=Column(JSONB, nullable=False))
+    regions_included: List[str] = Field(default_factory=list, sa_column=Column(JSONB, nullable=False))
 
     # Output format
-    output_format: str = Field(max_length=20, default="PDF")  # PDF, CSV, JSON
-    chart_specifications: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
+    output_format: OutputFormat = Field(
+        default=OutputFormat.PDF, sa_column=Column(IntEnumType(OutputFormat), nullable=False)
+    )
+    chart_specifications: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSONB, nullable=False))
 
     # Scheduling
     schedule_pattern: Optional[str] = Field(default=None, max_length=100)  # cron-like pattern
     auto_send: bool = Field(default=False)
-    recipients: List[str] = Field(default=[], sa_column=Column(JSON))
+    recipients: List[str] = Field(default_factory=list, sa_column=Column(JSONB, nullable=False))
 
     is_active: bool = Field(default=True)
     created_by: Optional[str] = Field(default=None, max_length=100)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
 
 
 # Alert and Monitoring Models
@@ -373,41 +667,52 @@ class DataAlert(SQLModel, table=True):
     """Alerts for data anomalies and significant changes"""
 
     __tablename__ = "data_alerts"  # type: ignore[assignment]
+    __table_args__ = {"info": {"fillfactor": HOT_UPDATE_FILLFACTOR}}
 
     id: Optional[int] = Field(default=None, primary_key=True)
     alert_name: str = Field(max_length=200)
     alert_type: str = Field(max_length=50)  # threshold, anomaly, missing_data, price_spike
 
     # Alert criteria
-    product_type: Optional[ProductType] = Field(default=None)
-    threshold_value: Optional[Decimal] = Field(default=None, decimal_places=4, max_digits=15)
-    threshold_operator: Optional[str] = Field(default=None, max_length=10)  # >, <, >=, <=, =
+    product_type: Optional[ProductType] = Field(default=None, sa_column=Column(IntEnumType(ProductType)))
+    threshold_value: Optional[float] = Field(default=None)
+    threshold_operator: Optional[ThresholdOperator] = Field(
+        default=None, sa_column=Column(IntEnumType(ThresholdOperator))
+    )
 
     # Configuration
     check_frequency_minutes: int = Field(default=60, ge=1)
     cooldown_hours: int = Field(default=24, ge=1)
-    severity_level: SeverityLevel = Field(default=SeverityLevel.MODERATE)
+    severity_level: SeverityLevel = Field(
+        default=SeverityLevel.MODERATE, sa_column=Column(IntEnumType(SeverityLevel), nullable=False)
+    )
 
     is_active: bool = Field(default=True)
-    last_triggered: Optional[datetime] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    last_triggered: Optional[datetime] = Field(default=None, sa_column=Column(DateTime(timezone=True)))
+    created_at: datetime = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
 
 
 # Non-persistent schemas for API and validation
 
 
 class EIADataPointCreate(SQLModel, table=False):
+    model_config = ConfigDict(frozen=True, from_attributes=True, validate_assignment=False)  # type: ignore[assignment]
+
     series_id: str = Field(max_length=100)
     data_source: DataSourceType
     product_type: ProductType
     disposition_type: DispositionType
     period_date: date
-    value: Decimal = Field(decimal_places=2, max_digits=15)
-    unit: str = Field(max_length=50)
+    value: float
+    unit: Unit
     region: Optional[str] = Field(default=None, max_length=100)
 
 
 class ScenarioCreate(SQLModel, table=False):
+    model_config = ConfigDict(frozen=True, from_attributes=True, validate_assignment=False)  # type: ignore[assignment]
+
     name: str = Field(max_length=200)
     description: str = Field(max_length=1000)
     scenario_type: ScenarioType
@@ -415,31 +720,35 @@ class ScenarioCreate(SQLModel, table=False):
     start_date: date
     end_date: date
     hurricane_category: Optional[int] = Field(default=None, ge=1, le=5)
-    affected_regions: List[str] = Field(default=[])
-    production_impact_pct: Decimal = Field(default=Decimal("0"), decimal_places=2, max_digits=5)
-    refining_capacity_impact_pct: Decimal = Field(default=Decimal("0"), decimal_places=2, max_digits=5)
-    import_disruption_pct: Decimal = Field(default=Decimal("0"), decimal_places=2, max_digits=5)
-    parameters: Dict[str, Any] = Field(default={})
+    affected_regions: List[str] = Field(default_factory=list)  # Region.code values
+    production_impact_pct: float = Field(default=0.0)
+    refining_capacity_impact_pct: float = Field(default=0.0)
+    import_disruption_pct: float = Field(default=0.0)
+    parameters: Dict[str, Any] = Field(default_factory=dict)
 
 
 class ScenarioUpdate(SQLModel, table=False):
+    model_config = ConfigDict(frozen=True, from_attributes=True, validate_assignment=False)  # type: ignore[assignment]
+
     name: Optional[str] = Field(default=None, max_length=200)
     description: Optional[str] = Field(default=None, max_length=1000)
     severity_level: Optional[SeverityLevel] = Field(default=None)
     start_date: Optional[date] = Field(default=None)
     end_date: Optional[date] = Field(default=None)
-    production_impact_pct: Optional[Decimal] = Field(default=None, decimal_places=2, max_digits=5)
-    refining_capacity_impact_pct: Optional[Decimal] = Field(default=None, decimal_places=2, max_digits=5)
-    import_disruption_pct: Optional[Decimal] = Field(default=None, decimal_places=2, max_digits=5)
+    production_impact_pct: Optional[float] = Field(default=None)
+    refining_capacity_impact_pct: Optional[float] = Field(default=None)
+    import_disruption_pct: Optional[float] = Field(default=None)
     parameters: Optional[Dict[str, Any]] = Field(default=None)
     is_active: Optional[bool] = Field(default=None)
 
 
 class DashboardConfigCreate(SQLModel, table=False):
+    model_config = ConfigDict(frozen=True, from_attributes=True, validate_assignment=False)  # type: ignore[assignment]
+
     config_name: str = Field(max_length=100)
     dashboard_type: str = Field(max_length=50)
-    chart_configs: Dict[str, Any] = Field(default={})
-    data_filters: Dict[str, Any] = Field(default={})
+    chart_configs: Dict[str, Any] = Field(default_factory=dict)
+    data_filters: Dict[str, Any] = Field(default_factory=dict)
     refresh_interval_minutes: int = Field(default=60, ge=1)
     default_date_range_days: int = Field(default=365, ge=1)
     include_forecasts: bool = Field(default=True)
@@ -449,10 +758,14 @@ class DashboardConfigCreate(SQLModel, table=False):
 class SupplyDispositionSummary(SQLModel, table=False):
     """Summary view for supply disposition data"""
 
+    model_config = ConfigDict(  # type: ignore[assignment]
+        frozen=True, from_attributes=True, validate_assignment=False, extra="ignore"
+    )
+
     product_type: ProductType
     period_date: date
-    total_supply: Decimal = Field(decimal_places=2, max_digits=15)
-    total_disposition: Decimal = Field(decimal_places=2, max_digits=15)
-    balance: Decimal = Field(decimal_places=2, max_digits=15)
-    unit: str
+    total_supply: float
+    total_disposition: float
+    balance: float
+    unit: Unit
     region: Optional[str] = Field(default=None)
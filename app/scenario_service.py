@@ -0,0 +1,33 @@
+from typing import List, Sequence
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, col, select
+
+from app.database import get_session
+from app.models import Region, Scenario, ScenarioCreate
+
+
+def resolve_regions(session: Session, codes: Sequence[str]) -> List[Region]:
+    """Region rows for the given codes in the same order, creating the codes not seen before"""
+    unique_codes = list(dict.fromkeys(codes))
+    if not unique_codes:
+        return []
+
+    session.exec(
+        insert(Region).values([{"code": code} for code in unique_codes]).on_conflict_do_nothing(index_elements=["code"])
+    )
+    regions = {region.code: region for region in session.exec(select(Region).where(col(Region.code).in_(unique_codes)))}
+    return [regions[code] for code in unique_codes]
+
+
+def create_scenario(data: ScenarioCreate) -> Scenario:
+    """Persist a scenario and link it to its affected regions; the returned scenario has regions loaded"""
+    with get_session() as session:
+        scenario = Scenario(**data.model_dump(exclude={"affected_regions"}))
+        scenario.regions = resolve_regions(session, data.affected_regions)
+        session.add(scenario)
+        session.commit()
+
+        query = select(Scenario).options(selectinload(Scenario.regions)).where(Scenario.id == scenario.id)
+        return session.exec(query).one()
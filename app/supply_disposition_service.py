@@ -0,0 +1,46 @@
+from datetime import date
+from typing import List, Optional
+
+from sqlmodel import asc, select
+
+from app.database import get_session, refresh_materialized_views
+from app.models import ProductType, SupplyDispositionSummary, SupplyDispositionSummaryView
+
+
+def get_supply_disposition_summary(
+    product_type: ProductType, start_date: date, end_date: date, region: Optional[str] = None
+) -> List[SupplyDispositionSummary]:
+    """Supply/disposition balance per period, read from the precomputed summary view as plain rows.
+
+    Chart endpoints only need the totals, so the query bypasses ORM hydration and the
+    summaries are built with model_construct since the database already produced valid values.
+    """
+    view = SupplyDispositionSummaryView
+    query = (
+        select(
+            view.product_type,
+            view.period_date,
+            view.total_supply,
+            view.total_disposition,
+            view.balance,
+            view.unit,
+            view.region,
+        )
+        .where(
+            view.product_type == product_type,
+            view.period_date >= start_date,
+            view.period_date <= end_date,
+        )
+        .order_by(asc(view.period_date))
+    )
+    if region is not None:
+        query = query.where(view.region == region)
+
+    with get_session() as session:
+        rows = session.exec(query).mappings().all()
+    return [SupplyDispositionSummary.model_construct(**row) for row in rows]
+
+
+def refresh_supply_disposition_summary() -> None:
+    """Bring the summary view up to date, e.g. after writes made with get_session(refresh_views=False)"""
+    refresh_materialized_views([SupplyDispositionSummaryView.__tablename__])
@@ -1,5 +1,6 @@
 from typing import Generator
 import pytest
+from app.database import reset_db
 from app.startup import startup
 from nicegui.testing import User
 
@@ -10,3 +11,10 @@ pytest_plugins = ["nicegui.testing.plugin"]
 def user(user: User) -> Generator[User, None, None]:
     startup()
     yield user
+
+
+@pytest.fixture()
+def clean_db():
+    reset_db()
+    yield
+    reset_db()
@@ -0,0 +1,95 @@
+from datetime import date
+
+from sqlmodel import select, text
+
+from app.database import ENGINE, PARTITION_YEARS_AHEAD, create_tables, get_session
+from app.ingest import bulk_copy
+from app.models import DataSourceType, DispositionType, EIADataPoint, PriceForecast, PriceType, ProductType, Unit
+
+
+def partitions_of(table_name: str) -> set[str]:
+    with ENGINE.connect() as conn:
+        return set(conn.execute(text(f"SELECT DISTINCT tableoid::regclass::text FROM {table_name}")).scalars())
+
+
+def test_future_dated_rows_survive_restart(clean_db):
+    year = date.today().year + PARTITION_YEARS_AHEAD + 3
+    with get_session() as session:
+        session.add(
+            PriceForecast(
+                product_type=ProductType.GASOLINE,
+                forecast_date=date(year, 6, 1),
+                forecast_price=3.9,
+                baseline_price=3.5,
+                price_impact=0.4,
+                price_impact_pct=11.4,
+                price_type=PriceType.RETAIL,
+                location="US",
+                unit=Unit.USD_GAL,
+            )
+        )
+        session.commit()
+
+    create_tables()
+
+    assert partitions_of("price_forecasts") == {f"price_forecasts_y{year}"}
+    with get_session() as session:
+        assert len(session.exec(select(PriceForecast)).all()) == 1
+
+
+def make_points(*years: int) -> list[EIADataPoint]:
+    return [
+        EIADataPoint(
+            series_id="PET.WCRFPUS2.W",
+            data_source=DataSourceType.WEEKLY,
+            product_type=ProductType.CRUDE_OIL,
+            disposition_type=DispositionType.PRODUCTION,
+            period_date=date(year, 1, 3),
+            value=6500.0,
+            unit=Unit.MBBL_D,
+        )
+        for year in years
+    ]
+
+
+def partition_exists(name: str) -> bool:
+    with ENGINE.connect() as conn:
+        return conn.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar() is not None
+
+
+def test_backfilled_rows_get_yearly_partitions(clean_db):
+    points = make_points(1995, 2005)
+    with get_session() as session:
+        bulk_copy(session, EIADataPoint, points)
+        session.commit()
+
+    assert partitions_of("eia_data_points") == {"eia_data_points_y1995", "eia_data_points_y2005"}
+
+
+def test_no_default_partition(clean_db):
+    with ENGINE.connect() as conn:
+        assert conn.execute(text("SELECT to_regclass('eia_data_points_default')")).scalar() is None
+
+
+def test_partitions_are_created_outside_the_writing_transaction(clean_db):
+    with get_session() as session:
+        session.add_all(make_points(1990))
+        session.flush()
+        session.rollback()
+
+    assert partition_exists("eia_data_points_y1990")
+
+
+def test_partitions_after_a_write_join_the_writing_transaction(clean_db):
+    with get_session() as session:
+        session.add_all(make_points(date.today().year))
+        session.flush()
+        bulk_copy(session, EIADataPoint, make_points(1991))
+        session.rollback()
+
+    assert not partition_exists("eia_data_points_y1991")
+
+    with get_session() as session:
+        bulk_copy(session, EIADataPoint, make_points(1991))
+        session.commit()
+    assert partitions_of("eia_data_points") == {"eia_data_points_y1991"}
@@ -0,0 +1,157 @@
+from datetime import date
+
+import pytest
+from sqlmodel import select, text
+
+from app.database import ENGINE, get_session
+from app.ingest import COPY_THRESHOLD, bulk_copy, copy_buffer
+from app.models import DataSourceType, DispositionType, EIADataPoint, ProductType, SupplyDisposition, Unit
+
+
+def make_points(count: int) -> list[EIADataPoint]:
+    return [
+        EIADataPoint(
+            series_id=f"PET.WCRFPUS2.W.{index}",
+            data_source=DataSourceType.WEEKLY,
+            product_type=ProductType.CRUDE_OIL,
+            disposition_type=DispositionType.PRODUCTION,
+            period_date=date(2024, 1, 1 + index % 28),
+            value=13100.5,
+            unit=Unit.MBBL_D,
+        )
+        for index in range(count)
+    ]
+
+
+def test_copy_buffer_writes_null_marker_and_quotes_tabs():
+    buffer = copy_buffer([("PET.X", None, 'say "hi"\tthere', 1.5)])
+
+    assert buffer.read() == 'PET.X\t\\N\t"say ""hi""\tthere"\t1.5\n'
+
+
+def test_copy_buffer_empty():
+    assert copy_buffer([]).read() == ""
+
+
+@pytest.mark.parametrize("count", [COPY_THRESHOLD - 1, COPY_THRESHOLD])
+def test_bulk_copy_inserts_all_rows(clean_db, count: int):
+    with get_session() as session:
+        inserted = bulk_copy(session, EIADataPoint, make_points(count))
+        session.commit()
+
+    assert inserted == count
+    with get_session() as session:
+        stored = list(session.exec(select(EIADataPoint)).all())
+    assert len(stored) == count
+    assert all(point.id is not None and point.created_at is not None for point in stored)
+    assert stored[0].product_type == ProductType.CRUDE_OIL
+    assert stored[0].value == 13100.5
+
+
+def test_bulk_copy_no_rows(clean_db):
+    with get_session() as session:
+        assert bulk_copy(session, EIADataPoint, []) == 0
+
+
+@pytest.fixture()
+def slow_inserts(clean_db):
+    """Each INSERT/COPY into eia_data_points takes longer than the engine's 1s statement_timeout"""
+    with ENGINE.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE OR REPLACE FUNCTION slow_insert() RETURNS trigger LANGUAGE plpgsql AS "
+                "$$ BEGIN PERFORM pg_sleep(1.5); RETURN NULL; END $$"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE TRIGGER slow_insert BEFORE INSERT ON eia_data_points "
+                "FOR EACH STATEMENT EXECUTE FUNCTION slow_insert()"
+            )
+        )
+    yield
+    with ENGINE.begin() as conn:
+        conn.execute(text("DROP TRIGGER IF EXISTS slow_insert ON eia_data_points"))
+        conn.execute(text("DROP FUNCTION IF EXISTS slow_insert()"))
+
+
+@pytest.mark.parametrize("count", [COPY_THRESHOLD - 1, COPY_THRESHOLD])
+def test_bulk_copy_is_not_cut_off_by_statement_timeout(slow_inserts, count: int):
+    with get_session() as session:
+        assert bulk_copy(session, EIADataPoint, make_points(count)) == count
+        assert session.exec(text("SHOW statement_timeout")).scalar() == "1s"
+        session.commit()
+
+    with get_session() as session:
+        assert len(session.exec(select(EIADataPoint)).all()) == count
+
+
+def make_entry(index: int) -> SupplyDisposition:
+    """Even rows set production, every third row sets stock_build; the rest is left to server defaults"""
+    supplied: dict[str, float] = {}
+    if index % 2 == 0:
+        supplied["production"] = float(index)
+    if index % 3 == 0:
+        supplied["stock_build"] = 5.0
+    return SupplyDisposition(
+        product_type=ProductType.GASOLINE,
+        period_date=date(2024, 1, 1 + index % 28),
+        unit=Unit.MBBL_D,
+        region=f"PADD {index % 5 + 1}",
+        **supplied,
+    )
+
+
+@pytest.mark.parametrize("count", [COPY_THRESHOLD - 1, COPY_THRESHOLD * 2])
+def test_bulk_copy_applies_server_defaults_to_unset_columns(clean_db, count: int):
+    with get_session() as session:
+        assert bulk_copy(session, SupplyDisposition, [make_entry(index) for index in range(count)]) == count
+        session.commit()
+
+    with get_session() as session:
+        rows = list(session.exec(select(SupplyDisposition)).all())
+    assert len(rows) == count
+    assert all(row.created_at is not None and row.imports == 0.0 for row in rows)
+    assert sorted(row.production for row in rows) == sorted(
+        float(index) if index % 2 == 0 else 0.0 for index in range(count)
+    )
+    assert sum(row.stock_build for row in rows) == 5.0 * len(range(0, count, 3))
+
+
+COMPONENTS = [
+    "production",
+    "imports",
+    "stock_withdrawal",
+    "exports",
+    "refinery_input",
+    "product_supplied",
+    "stock_build",
+]
+
+
+@pytest.mark.parametrize("count", [COPY_THRESHOLD - 1, COPY_THRESHOLD * 2])
+def test_bulk_copy_fills_constant_defaults_for_many_column_combinations(clean_db, count: int):
+    """Row i sets the components picked by the bits of i, giving far more than MAX_COPY_GROUPS combinations"""
+    entries = [
+        SupplyDisposition(
+            product_type=ProductType.DISTILLATE,
+            period_date=date(2024, 1, 1),
+            unit=Unit.MBBL_D,
+            region=f"PADD {index}",
+            **{name: float(index) for bit, name in enumerate(COMPONENTS) if index >> bit & 1},
+        )
+        for index in range(count)
+    ]
+    with get_session() as session:
+        assert bulk_copy(session, SupplyDisposition, entries) == count
+        session.commit()
+
+    with get_session() as session:
+        rows = {row.region: row for row in session.exec(select(SupplyDisposition)).all()}
+    assert len(rows) == count
+    for index in range(count):
+        row = rows[f"PADD {index}"]
+        assert row.created_at is not None
+        assert [getattr(row, name) for name in COMPONENTS] == [
+            float(index) if index >> bit & 1 else 0.0 for bit, name in enumerate(COMPONENTS)
+        ]
@@ -0,0 +1,174 @@
+from datetime import date
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import DetachedInstanceError
+from sqlmodel import SQLModel, select
+
+from app.database import get_session
+from app.models import (
+    DashboardConfig,
+    DataSourceType,
+    DispositionType,
+    EIADataPoint,
+    EIADataPointCreate,
+    HurricaneHistorical,
+    ProductType,
+    ReportTemplate,
+    Scenario,
+    ScenarioCreate,
+    ScenarioImpact,
+    ScenarioType,
+    SeasonalPattern,
+    SeverityLevel,
+    Unit,
+    with_loaded_configs,
+)
+
+
+def make_scenario(**overrides) -> Scenario:
+    fields = dict(
+        name="Gulf hurricane",
+        description="Category 4 landfall near Houston",
+        scenario_type=ScenarioType.HURRICANE,
+        severity_level=SeverityLevel.HIGH,
+        start_date=date(2024, 8, 1),
+        end_date=date(2024, 9, 1),
+    )
+    return Scenario(**{**fields, **overrides})
+
+
+def test_server_filled_timestamps_are_not_required_for_validation():
+    point = EIADataPoint.model_validate(
+        EIADataPointCreate(
+            series_id="PET.WCRFPUS2.W",
+            data_source=DataSourceType.WEEKLY,
+            product_type=ProductType.CRUDE_OIL,
+            disposition_type=DispositionType.PRODUCTION,
+            period_date=date(2024, 1, 5),
+            value=13100.5,
+            unit=Unit.MBBL_D,
+        )
+    )
+    assert point.created_at is None and point.updated_at is None
+
+    data = ScenarioCreate(
+        name="Gulf hurricane",
+        description="Category 4 landfall near Houston",
+        scenario_type=ScenarioType.HURRICANE,
+        severity_level=SeverityLevel.HIGH,
+        start_date=date(2024, 8, 1),
+        end_date=date(2024, 9, 1),
+        affected_regions=["PADD 3"],
+    )
+    scenario = Scenario.model_validate(data.model_dump(exclude={"affected_regions"}))
+    assert scenario.created_at is None
+
+
+def assert_rejected(row: SQLModel, constraint: str) -> None:
+    with get_session() as session:
+        session.add(row)
+        with pytest.raises(IntegrityError, match=constraint):
+            session.commit()
+
+
+def test_scenario_check_constraints(clean_db):
+    assert_rejected(make_scenario(production_impact_pct=-120.0), "ck_scenarios_production_impact_pct")
+    assert_rejected(make_scenario(hurricane_category=6), "ck_scenarios_hurricane_category")
+
+
+def test_scenario_impact_check_constraint(clean_db):
+    with get_session() as session:
+        scenario = make_scenario()
+        session.add(scenario)
+        session.commit()
+        scenario_id = scenario.id
+    assert scenario_id is not None
+
+    def make_impact(scenario_value: float) -> ScenarioImpact:
+        return ScenarioImpact(
+            scenario_id=scenario_id,
+            product_type=ProductType.CRUDE_OIL,
+            disposition_type=DispositionType.PRODUCTION,
+            impact_date=date(2024, 8, 15),
+            baseline_value=1800.0,
+            scenario_value=scenario_value,
+            impact_absolute=scenario_value - 1800.0,
+            impact_percentage=(scenario_value - 1800.0) / 1800.0 * 100,
+            unit=Unit.MBBL_D,
+        )
+
+    assert_rejected(make_impact(-1440.0), "ck_scenario_impacts_impact_percentage")
+
+    # imports or prices can more than double in a disruption
+    with get_session() as session:
+        session.add(make_impact(5400.0))
+        session.commit()
+
+
+def test_seasonal_pattern_check_constraint(clean_db):
+    pattern = SeasonalPattern(
+        product_type=ProductType.GASOLINE,
+        disposition_type=DispositionType.DEMAND,
+        month=13,
+        seasonal_index=1.1,
+    )
+    assert_rejected(pattern, "ck_seasonal_patterns_month")
+
+
+def test_hurricane_historical_check_constraint(clean_db):
+    hurricane = HurricaneHistorical(
+        hurricane_name="Harvey",
+        year=2017,
+        category=4,
+        landfall_date=date(2017, 8, 25),
+        refinery_capacity_lost_pct=140.0,
+    )
+    assert_rejected(hurricane, "ck_hurricane_historical_refinery_capacity_lost_pct")
+
+
+@pytest.fixture()
+def dashboard_config(clean_db):
+    with get_session() as session:
+        session.add(
+            DashboardConfig(
+                config_name="gulf-coast",
+                dashboard_type="supply_disposition",
+                chart_configs={"balance": {"type": "line"}},
+                data_filters={"region": "PADD 3"},
+            )
+        )
+        session.commit()
+
+
+def test_payload_columns_are_not_selected_by_default():
+    default_sql = str(select(DashboardConfig))
+    loaded_sql = str(select(DashboardConfig).options(with_loaded_configs()))
+
+    assert "chart_configs" not in default_sql and "data_filters" not in default_sql
+    assert "chart_configs" in loaded_sql and "data_filters" in loaded_sql
+    assert "recipients" not in str(select(ReportTemplate))
+
+
+def test_deferred_payload_loads_on_access_within_session(dashboard_config):
+    with get_session() as session:
+        config = session.exec(select(DashboardConfig)).one()
+        assert "chart_configs" not in config.model_dump()
+        assert config.chart_configs == {"balance": {"type": "line"}}
+
+
+def test_deferred_payload_is_unavailable_after_session_closes(dashboard_config):
+    with get_session() as session:
+        config = session.exec(select(DashboardConfig)).one()
+
+    with pytest.raises(DetachedInstanceError):
+        _ = config.data_filters
+
+
+def test_with_loaded_configs_loads_payload(dashboard_config):
+    with get_session() as session:
+        config = session.exec(select(DashboardConfig).options(with_loaded_configs())).one()
+
+    dumped = config.model_dump()
+    assert dumped["chart_configs"] == {"balance": {"type": "line"}}
+    assert dumped["data_filters"] == {"region": "PADD 3"}
@@ -1,5 +1,7 @@
 """Smoke test for SQLModel database setup."""
 
+from datetime import date
+
 import pytest
 from sqlmodel import SQLModel, text
 import os
@@ -19,6 +21,9 @@ def test_sqlmodel_smoke():
         # PostgreSQL-specific query to list tables
         result = conn.execute(text("SELECT tablename FROM pg_tables WHERE schemaname = 'public'"))
         db_tables = {row[0] for row in result}
+        # summary models are backed by materialized views
+        result = conn.execute(text("SELECT matviewname FROM pg_matviews WHERE schemaname = 'public'"))
+        db_tables |= {row[0] for row in result}
 
     # Verify we have tables and they match our models
     assert len(db_tables) > 0, "No tables found in database"
@@ -28,6 +33,21 @@ def test_sqlmodel_smoke():
         assert table_name in db_tables, f"Table '{table_name}' not found in database"
 
 
+@pytest.mark.sqlmodel
+def test_fillfactor_applied():
+    create_tables()
+
+    with ENGINE.connect() as conn:
+        result = conn.execute(text("SELECT relname, reloptions FROM pg_class WHERE relkind = 'r'"))
+        reloptions = {row[0]: row[1] or [] for row in result}
+
+    for table in SQLModel.metadata.sorted_tables:
+        if "fillfactor" in table.info:
+            assert f"fillfactor={table.info['fillfactor']}" in reloptions[table.name]
+    partition = f"eia_data_points_y{date.today().year}"
+    assert not any(option.startswith("fillfactor") for option in reloptions[partition])
+
+
 DATABRICKS_HOST = os.environ.get("DATABRICKS_HOST")
 DATABRICKS_TOKEN = os.environ.get("DATABRICKS_TOKEN")
 
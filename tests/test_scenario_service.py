@@ -0,0 +1,67 @@
+from datetime import date
+
+from sqlalchemy.orm import selectinload
+from sqlmodel import select
+
+from app.database import get_session
+from app.models import (
+    HurricaneHistorical,
+    Region,
+    Scenario,
+    ScenarioCreate,
+    ScenarioRegion,
+    ScenarioType,
+    SeverityLevel,
+)
+from app.scenario_service import create_scenario, resolve_regions
+
+
+def make_scenario_create(name: str, affected_regions: list[str]) -> ScenarioCreate:
+    return ScenarioCreate(
+        name=name,
+        description="Gulf Coast landfall",
+        scenario_type=ScenarioType.HURRICANE,
+        severity_level=SeverityLevel.HIGH,
+        start_date=date(2024, 8, 1),
+        end_date=date(2024, 9, 1),
+        hurricane_category=4,
+        affected_regions=affected_regions,
+    )
+
+
+def test_create_scenario_links_regions(clean_db):
+    scenario = create_scenario(make_scenario_create("Harvey replay", ["PADD 3", "PADD 1", "PADD 3"]))
+
+    assert [region.code for region in scenario.regions] == ["PADD 3", "PADD 1"]
+
+
+def test_regions_are_shared_through_link_table(clean_db):
+    first = create_scenario(make_scenario_create("Harvey replay", ["PADD 3", "PADD 1"]))
+    second = create_scenario(make_scenario_create("Ida replay", ["PADD 3"]))
+
+    with get_session() as session:
+        assert len(session.exec(select(Region)).all()) == 2
+        query = (
+            select(Scenario.id)
+            .join(ScenarioRegion, ScenarioRegion.scenario_id == Scenario.id)
+            .join(Region, Region.id == ScenarioRegion.region_id)
+            .where(Region.code == "PADD 3")
+        )
+        assert set(session.exec(query).all()) == {first.id, second.id}
+
+
+def test_resolve_regions_for_hurricanes(clean_db):
+    with get_session() as session:
+        hurricane = HurricaneHistorical(hurricane_name="Harvey", year=2017, category=4, landfall_date=date(2017, 8, 25))
+        hurricane.regions = resolve_regions(session, ["PADD 3", "Houston"])
+        session.add(hurricane)
+        session.commit()
+
+    with get_session() as session:
+        stored = session.exec(select(HurricaneHistorical).options(selectinload(HurricaneHistorical.regions))).one()
+        assert sorted(region.code for region in stored.regions) == ["Houston", "PADD 3"]
+
+
+def test_resolve_regions_empty(clean_db):
+    with get_session() as session:
+        assert resolve_regions(session, []) == []
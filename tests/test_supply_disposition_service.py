@@ -0,0 +1,197 @@
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import InvalidRequestError
+from sqlmodel import select
+
+import app.database
+
+from app.database import get_session
+from app.ingest import bulk_copy
+from app.models import (
+    DataSourceType,
+    DispositionType,
+    EIADataPoint,
+    ProductType,
+    SupplyDisposition,
+    SupplyDispositionSummary,
+    Unit,
+)
+from app.supply_disposition_service import get_supply_disposition_summary, refresh_supply_disposition_summary
+
+
+@pytest.fixture()
+def sample_data(clean_db):
+    with get_session(refresh_views=False) as session:
+        session.add_all(
+            [
+                SupplyDisposition(
+                    product_type=ProductType.GASOLINE,
+                    period_date=date(2024, 1, 1),
+                    production=100.0,
+                    imports=20.0,
+                    exports=10.0,
+                    product_supplied=90.0,
+                    unit=Unit.MBBL_D,
+                    region="PADD 3",
+                ),
+                SupplyDisposition(
+                    product_type=ProductType.GASOLINE,
+                    period_date=date(2024, 1, 1),
+                    production=50.0,
+                    product_supplied=40.0,
+                    unit=Unit.MBBL_D,
+                    region="PADD 3",
+                ),
+                SupplyDisposition(
+                    product_type=ProductType.GASOLINE,
+                    period_date=date(2024, 2, 1),
+                    production=80.0,
+                    stock_build=5.0,
+                    unit=Unit.MBBL_D,
+                    region="PADD 1",
+                ),
+                SupplyDisposition(
+                    product_type=ProductType.CRUDE_OIL,
+                    period_date=date(2024, 1, 1),
+                    production=500.0,
+                    unit=Unit.MBBL_D,
+                    region="PADD 3",
+                ),
+            ]
+        )
+        session.commit()
+    refresh_supply_disposition_summary()
+
+
+def make_entry(production: float) -> SupplyDisposition:
+    return SupplyDisposition(
+        product_type=ProductType.PROPANE,
+        period_date=date(2024, 3, 1),
+        production=production,
+        unit=Unit.MBBL_D,
+        region="PADD 2",
+    )
+
+
+def propane_summaries() -> list[SupplyDispositionSummary]:
+    return get_supply_disposition_summary(ProductType.PROPANE, date(2024, 1, 1), date(2024, 12, 31))
+
+
+def test_summary_aggregates_per_period(sample_data):
+    summaries = get_supply_disposition_summary(ProductType.GASOLINE, date(2024, 1, 1), date(2024, 12, 31))
+
+    assert [summary.period_date for summary in summaries] == [date(2024, 1, 1), date(2024, 2, 1)]
+    january = summaries[0]
+    assert january.product_type == ProductType.GASOLINE
+    assert january.total_supply == 170.0
+    assert january.total_disposition == 140.0
+    assert january.balance == 30.0
+    assert january.unit == Unit.MBBL_D
+    assert january.region == "PADD 3"
+
+
+def test_summary_filters_by_region_and_dates(sample_data):
+    summaries = get_supply_disposition_summary(ProductType.GASOLINE, date(2024, 1, 1), date(2024, 1, 31), "PADD 1")
+    assert summaries == []
+
+    summaries = get_supply_disposition_summary(ProductType.GASOLINE, date(2024, 1, 1), date(2024, 12, 31), "PADD 1")
+    assert len(summaries) == 1
+    assert summaries[0].balance == 75.0
+
+
+def test_summary_rows_are_frozen_schemas(sample_data):
+    summary = get_supply_disposition_summary(ProductType.CRUDE_OIL, date(2024, 1, 1), date(2024, 12, 31))[0]
+
+    assert isinstance(summary, SupplyDispositionSummary)
+    with pytest.raises(ValidationError):
+        summary.balance = 0.0
+
+
+def test_orm_writes_show_up_after_refresh(clean_db):
+    with get_session(refresh_views=False) as session:
+        session.add(make_entry(42.0))
+        session.commit()
+    assert propane_summaries() == []
+
+    refresh_supply_disposition_summary()
+
+    assert [summary.total_supply for summary in propane_summaries()] == [42.0]
+
+
+def test_commit_refreshes_summary(clean_db):
+    with get_session() as session:
+        session.add(make_entry(42.0))
+        session.commit()
+    assert [summary.total_supply for summary in propane_summaries()] == [42.0]
+
+    with get_session() as session:
+        bulk_copy(session, SupplyDisposition, [make_entry(8.0)])
+        session.commit()
+    assert [summary.total_supply for summary in propane_summaries()] == [50.0]
+
+    with get_session() as session:
+        session.exec(insert(SupplyDisposition).values(make_entry(5.0).model_dump(exclude_unset=True)))
+        session.commit()
+    assert [summary.total_supply for summary in propane_summaries()] == [55.0]
+
+
+def test_failed_refresh_does_not_fail_commit(clean_db, monkeypatch, caplog):
+    def fail(view_names):
+        raise RuntimeError("refresh failed")
+
+    monkeypatch.setattr(app.database, "refresh_materialized_views", fail)
+    with get_session() as session:
+        session.add(make_entry(42.0))
+        session.commit()
+
+    assert "supply_disposition_summary" in caplog.text
+    assert propane_summaries() == []
+    refresh_supply_disposition_summary()
+    assert [summary.total_supply for summary in propane_summaries()] == [42.0]
+
+
+def test_summary_empty(clean_db):
+    assert get_supply_disposition_summary(ProductType.PROPANE, date(2024, 1, 1), date(2024, 12, 31)) == []
+
+
+def test_relationships_do_not_lazy_load(sample_data):
+    with get_session() as session:
+        entry = session.exec(select(SupplyDisposition)).first()
+        assert entry is not None
+        with pytest.raises(InvalidRequestError):
+            _ = entry.data_point
+
+
+def test_unlinking_data_point_keeps_entry_keys(clean_db):
+    with get_session() as session:
+        point = EIADataPoint(
+            series_id="PET.WGFRPUS2.W",
+            data_source=DataSourceType.WEEKLY,
+            product_type=ProductType.GASOLINE,
+            disposition_type=DispositionType.PRODUCTION,
+            period_date=date(2024, 3, 1),
+            value=9800.0,
+            unit=Unit.MBBL_D,
+        )
+        session.add(point)
+        session.flush()
+        entry = make_entry(42.0)
+        entry.data_point_id = point.id
+        session.add(entry)
+        session.commit()
+        key = (entry.id, entry.period_date)
+
+    with get_session() as session:
+        entry = session.get(SupplyDisposition, key)
+        assert entry is not None
+        entry.data_point = None
+        session.commit()
+
+    with get_session() as session:
+        entry = session.get(SupplyDisposition, key)
+        assert entry is not None
+        assert entry.period_date == date(2024, 3, 1)
+        assert entry.data_point_id is not None